@@ -0,0 +1,5 @@
+# Makes the 'src' package importable when running pytest from this folder.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,6 +14,16 @@ from src.main import PipelineOrchestrator
 # Define a Function App instance
 app = func.FunctionApp()
 
+# One orchestrator per worker process, so its error template cache survives
+# across invocations instead of starting empty for every Event Hub batch.
+_orchestrator = None
+
+def _get_orchestrator() -> PipelineOrchestrator:
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = PipelineOrchestrator()
+    return _orchestrator
+
 @app.event_hub_message_trigger(
     arg_name="event",
     event_hub_name="pipeline-events",
@@ -24,7 +34,7 @@ def ProcessPipelineEvent(event: func.EventHubEvent):
     logging.info('Python EventHub trigger function processed an event.')
 
     try:
-        orchestrator = PipelineOrchestrator()
+        orchestrator = _get_orchestrator()
 
         for event_data in event:
             try:
@@ -45,7 +55,7 @@ def ScheduledMonitor(myTimer: func.TimerRequest) -> None:
         logging.info('The timer is past due!')
 
     try:
-        orchestrator = PipelineOrchestrator()
+        orchestrator = _get_orchestrator()
         orchestrator.run_continuous_simulation(total_runs=50)
 
     except Exception as e:
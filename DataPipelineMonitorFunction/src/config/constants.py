@@ -43,6 +43,14 @@ ERROR_CATEGORIES = [
     ERROR_CATEGORY_UNKNOWN
 ]
 
+# --- Error Message Templating ---
+# Max number of raw messages (and template ids) the orchestrator keeps in memory
+ERROR_TEMPLATE_CACHE_SIZE = 1024
+# Default blob container for newly seen templates (loaded into DimErrorTemplate by ADF).
+# Kept apart from the staging container so the fact Copy Data never picks them up.
+# Override with the AZURE_ERROR_TEMPLATE_CONTAINER setting.
+ERROR_TEMPLATE_CONTAINER = "error-templates"
+
 # --- Simulation Parameters ---
 FAILURE_RATE = 0.50 # 30% chance of a pipeline failing initially
 MAX_ATTEMPTS = 3     # Max attempts before moving to DLQ (1 initial + 2 retries)
@@ -52,6 +60,31 @@ MAX_ATTEMPTS = 3     # Max attempts before moving to DLQ (1 initial + 2 retries)
 # E.g., 1st retry: 2^0 * 2s = 2s, 2nd retry: 2^1 * 2s = 4s, 3rd retry: 2^2 * 2s = 8s
 BASE_BACKOFF_TIME_SECONDS = 2
 
+# --- Retry Policies (per error category) ---
+# Validation/Schema/Security style failures will never succeed on retry, so they
+# go to the DLQ after the first attempt. Categories missing here fall back to
+# MAX_ATTEMPTS with BASE_BACKOFF_TIME_SECONDS exponential backoff.
+# trips_circuit marks failures that suggest a dependency is down.
+RETRY_POLICIES = {
+    ERROR_CATEGORY_CONNECTION: {"retryable": True, "max_attempts": 3, "base_backoff_seconds": 2, "max_backoff_seconds": 30, "trips_circuit": True},
+    ERROR_CATEGORY_VALIDATION: {"retryable": False},
+    ERROR_CATEGORY_DEPENDENCY: {"retryable": True, "max_attempts": 4, "base_backoff_seconds": 5, "max_backoff_seconds": 60, "jitter_ratio": 0.25, "trips_circuit": True},
+    ERROR_CATEGORY_SECURITY: {"retryable": False},
+    ERROR_CATEGORY_BUSINESSRULE: {"retryable": False},
+    ERROR_CATEGORY_SCHEMA: {"retryable": False},
+    ERROR_CATEGORY_RESOURCELIMIT: {"retryable": True, "max_attempts": 3, "base_backoff_seconds": 10, "backoff_multiplier": 3, "max_backoff_seconds": 90},
+    ERROR_CATEGORY_TIMEOUT: {"retryable": True, "max_attempts": 3, "base_backoff_seconds": 2, "max_backoff_seconds": 30},
+    ERROR_CATEGORY_INVALIDDATA: {"retryable": False},
+    ERROR_CATEGORY_UNKNOWN: {"retryable": True, "max_attempts": 2, "base_backoff_seconds": 2},
+}
+
+# Per-pipeline circuit breaker: after this many consecutive circuit-tripping
+# failures, runs of the pipeline go straight to the DLQ without executing until
+# the reset timeout passes and a trial run is allowed through.
+CIRCUIT_BREAKER_ENABLED = True
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS = 300
+
 # --- DLQ Statuses ---
 DLQ_STATUS_PENDING = "Pending"
 DLQ_STATUS_REPLAYED = "Replayed"
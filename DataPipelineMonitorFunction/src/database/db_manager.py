@@ -122,6 +122,15 @@ class DBManager:
                 );
             ''')
             logger.info("DimError table ensured.")
+            cursor.execute('''
+                IF NOT EXISTS (SELECT * FROM sys.tables WHERE name='DimErrorTemplate')
+                CREATE TABLE DimErrorTemplate (
+                    error_template_id CHAR(16) PRIMARY KEY,
+                    error_category VARCHAR(100),
+                    error_message_template VARCHAR(MAX) NOT NULL
+                );
+            ''')
+            logger.info("DimErrorTemplate table ensured.")
             cursor.execute('''
                 IF NOT EXISTS (SELECT * FROM sys.tables WHERE name='DimTime')
                 CREATE TABLE DimTime (
@@ -149,15 +158,38 @@ class DBManager:
                     end_timestamp DATETIME,
                     duration_seconds INT,
                     attempt_number INT NOT NULL DEFAULT 1,
-                    raw_error_message VARCHAR(MAX),
+                    error_template_id CHAR(16),
+                    error_params VARCHAR(MAX),
                     is_dlq BIT NOT NULL DEFAULT 0,
                     dlq_event_id UNIQUEIDENTIFIER DEFAULT NEWID(),
                     FOREIGN KEY (pipeline_id) REFERENCES DimPipeline(pipeline_id),
                     FOREIGN KEY (status_id) REFERENCES DimStatus(status_id),
                     FOREIGN KEY (error_id) REFERENCES DimError(error_id),
-                    FOREIGN KEY (time_id) REFERENCES DimTime(time_id)
+                    FOREIGN KEY (time_id) REFERENCES DimTime(time_id),
+                    FOREIGN KEY (error_template_id) REFERENCES DimErrorTemplate(error_template_id)
                 );
             ''')
+            # Tables created before error templating still carry raw_error_message;
+            # add the template columns alongside it so old rows stay readable.
+            cursor.execute('''
+                IF COL_LENGTH('FactPipelineRuns', 'error_template_id') IS NULL
+                ALTER TABLE FactPipelineRuns ADD error_template_id CHAR(16) NULL, error_params VARCHAR(MAX) NULL;
+            ''')
+            cursor.execute('''
+                IF NOT EXISTS (
+                    SELECT * FROM sys.foreign_keys
+                    WHERE parent_object_id = OBJECT_ID('FactPipelineRuns')
+                      AND referenced_object_id = OBJECT_ID('DimErrorTemplate')
+                )
+                ALTER TABLE FactPipelineRuns ADD FOREIGN KEY (error_template_id)
+                    REFERENCES DimErrorTemplate(error_template_id);
+            ''')
+            cursor.execute('''
+                IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name='IX_FactPipelineRuns_ErrorTemplate')
+                CREATE INDEX IX_FactPipelineRuns_ErrorTemplate
+                    ON FactPipelineRuns (error_template_id)
+                    INCLUDE (pipeline_id, status_id, time_id, is_dlq);
+            ''')
             logger.info("FactPipelineRuns table ensured.")
             cursor.execute('''
                 IF NOT EXISTS (SELECT * FROM sys.tables WHERE name='DLQEvents')
@@ -182,10 +214,24 @@ class DBManager:
                     end_timestamp VARCHAR(50),
                     duration_seconds INT,
                     error_category VARCHAR(100),
-                    error_message VARCHAR(MAX)
+                    error_template_id CHAR(16),
+                    error_params VARCHAR(MAX)
                 );
             ''')
+            cursor.execute('''
+                IF COL_LENGTH('FactPipelineRuns_Staging', 'error_template_id') IS NULL
+                ALTER TABLE FactPipelineRuns_Staging ADD error_template_id CHAR(16) NULL, error_params VARCHAR(MAX) NULL;
+            ''')
             logger.info("FactPipelineRuns_Staging table ensured.")
+            cursor.execute('''
+                IF NOT EXISTS (SELECT * FROM sys.tables WHERE name='DimErrorTemplate_Staging')
+                CREATE TABLE DimErrorTemplate_Staging (
+                    error_template_id CHAR(16),
+                    error_category VARCHAR(100),
+                    error_message_template VARCHAR(MAX)
+                );
+            ''')
+            logger.info("DimErrorTemplate_Staging table ensured.")
             self.cnxn.commit()
             logger.info("All tables created/ensured successfully.")
 
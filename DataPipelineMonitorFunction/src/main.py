@@ -17,6 +17,8 @@ if project_root not in sys.path:
 # --- END OF MANUAL PATH FIX ---
 
 from src.pipeline.pipeline_models import Pipeline, PipelineRunResult
+from src.pipeline.error_templater import ErrorTemplater
+from src.pipeline.retry_policy import RetryPolicyEngine, RetryStats, execute_with_retries
 from src.config import constants
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -27,21 +29,31 @@ class PipelineOrchestrator:
         # Get the connection string from the existing AzureWebJobsStorage setting
         self._staging_conn_str = os.getenv('AzureWebJobsStorage')
         self._staging_container = os.getenv('AZURE_STAGING_CONTAINER')
+        self._error_template_container = os.getenv(
+            'AZURE_ERROR_TEMPLATE_CONTAINER', constants.ERROR_TEMPLATE_CONTAINER
+        )
 
         if not self._staging_conn_str or not self._staging_container:
             raise ValueError("Staging blob storage not configured.")
 
         self._blob_service_client = BlobServiceClient.from_connection_string(self._staging_conn_str)
+        template_container_client = self._blob_service_client.get_container_client(self._error_template_container)
+        if not template_container_client.exists():
+            template_container_client.create_container()
         self._pipelines = [Pipeline(**p) for p in constants.PIPELINES]
+        self._error_templater = ErrorTemplater(max_cache_size=constants.ERROR_TEMPLATE_CACHE_SIZE)
+        # Lives as long as the orchestrator so circuit breakers remember a down
+        # dependency across scheduled runs.
+        self._retry_engine = RetryPolicyEngine()
         logger.info("Pipeline orchestrator initialized for blob storage.")
 
-    def _write_to_blob(self, event_data: dict, file_name: str):
+    def _write_to_blob(self, event_data: dict, file_name: str, container: str = None):
         """Writes a single event to a CSV file in blob storage with a simple folder structure."""
         try:
             # The file path is now just the container name and the file name
             full_path = file_name
             blob_client = self._blob_service_client.get_blob_client(
-                container=self._staging_container, blob=full_path
+                container=container or self._staging_container, blob=full_path
             )
 
             # Write a single row as CSV
@@ -58,6 +70,43 @@ class PipelineOrchestrator:
             logger.error(f"Failed to write to blob storage: {e}")
             raise
 
+    def _template_error_message(self, event_data: dict) -> dict:
+        """Replaces the raw error message with its template id and parameters."""
+        error_message = event_data.get("error_message")
+        template_id = None
+        error_params = ""
+
+        if error_message:
+            template, params, is_new = self._error_templater.classify(
+                event_data.get("error_category"), error_message
+            )
+            template_id = template.template_id
+            error_params = ErrorTemplater.serialize_params(params)
+
+            if is_new:
+                # Same id always maps to the same blob, so re-registering is harmless.
+                self._write_to_blob(
+                    {
+                        "error_template_id": template.template_id,
+                        "error_category": template.error_category,
+                        "error_message_template": template.template_text,
+                    },
+                    f"{template.template_id}.csv",
+                    container=self._error_template_container,
+                )
+                # Only after the upload succeeded, so a failed write is retried
+                # on the next event with this template.
+                self._error_templater.mark_registered(template.template_id)
+
+        templated = {}
+        for key, value in event_data.items():
+            if key == "error_message":
+                templated["error_template_id"] = template_id
+                templated["error_params"] = error_params
+            else:
+                templated[key] = value
+        return templated
+
     def process_event(self, event_data: dict):
         """Processes a single event and writes it to staging."""
         pipeline_name = event_data.get("pipeline_name")
@@ -65,58 +114,44 @@ class PipelineOrchestrator:
             logger.error("Event received without a 'pipeline_name'. Skipping.")
             return
 
+        event_data = self._template_error_message(event_data)
         file_name = f"{pipeline_name}/{uuid.uuid4()}.csv"
         self._write_to_blob(event_data, file_name)
 
+    def _build_event(self, pipeline: Pipeline, run_result: PipelineRunResult,
+                     attempt_number: int, is_dlq: bool) -> dict:
+        return {
+            "pipeline_name": pipeline.name,
+            "success": run_result.success,
+            "start_timestamp": run_result.start_timestamp.isoformat(),
+            "end_timestamp": run_result.end_timestamp.isoformat(),
+            "duration_seconds": run_result.duration_seconds,
+            "error_category": run_result.error_category,
+            "error_message": run_result.error_message,
+            "attempt_number": attempt_number,
+            "is_dlq": is_dlq
+        }
+
     def run_continuous_simulation(self, total_runs=100):
-        """Simulates pipeline runs and handles max_attempts logic."""
+        """Simulates pipeline runs, retrying failures per their error category's policy."""
         logger.info(f"Starting continuous simulation for {total_runs} total runs.")
+        retry_stats = RetryStats()
         run_count = 0
 
         while run_count < total_runs:
             pipeline = random.choice(self._pipelines)
-            attempt_number = 1
-
-            while attempt_number <= constants.MAX_ATTEMPTS:
-                run_result = pipeline.execute(attempt_number=attempt_number)
-
-                if run_result.success:
-                    event_data = {
-                        "pipeline_name": pipeline.name,
-                        "success": run_result.success,
-                        "start_timestamp": run_result.start_timestamp.isoformat(),
-                        "end_timestamp": run_result.end_timestamp.isoformat(),
-                        "duration_seconds": run_result.duration_seconds,
-                        "error_category": run_result.error_category,
-                        "error_message": run_result.error_message,
-                        "attempt_number": attempt_number,
-                        "is_dlq": False
-                    }
-                    self.process_event(event_data, attempt_number)
-                    break
-                else:
-                    if attempt_number == constants.MAX_ATTEMPTS:
-                        event_data = {
-                            "pipeline_name": pipeline.name,
-                            "success": run_result.success,
-                            "start_timestamp": run_result.start_timestamp.isoformat(),
-                            "end_timestamp": run_result.end_timestamp.isoformat(),
-                            "duration_seconds": run_result.duration_seconds,
-                            "error_category": run_result.error_category,
-                            "error_message": run_result.error_message,
-                            "attempt_number": attempt_number,
-                            "is_dlq": True
-                        }
-                        self.process_event(event_data, attempt_number)
-                        break
-                    wait_time = constants.BASE_BACKOFF_TIME_SECONDS * (2 ** (attempt_number - 1))
-                    jitter = random.uniform(0, 1) * wait_time * 0.1
-                    sleep_duration = wait_time + jitter
-                    time.sleep(sleep_duration)
-
-                attempt_number += 1
+            outcome = execute_with_retries(
+                pipeline.name,
+                lambda attempt_number: pipeline.execute(attempt_number=attempt_number),
+                self._retry_engine,
+            )
+            retry_stats.record(outcome)
+            self.process_event(
+                self._build_event(pipeline, outcome.run_result, outcome.attempt_number, is_dlq=outcome.is_dlq)
+            )
 
             run_count += 1
             time.sleep(random.uniform(2, 10))
 
-        logger.info(f"Continuous simulation of {total_runs} runs completed.")
\ No newline at end of file
+        logger.info(f"Continuous simulation of {total_runs} runs completed.")
+        logger.info(f"Retry policy summary: {retry_stats.summary()}")
\ No newline at end of file
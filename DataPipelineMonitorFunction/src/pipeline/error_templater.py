@@ -0,0 +1,132 @@
+# DataPipelineMonitorFunction/src/pipeline/error_templater.py
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Variable tokens are masked in order; earlier patterns win so a UUID is not
+# split into several numbers, a quoted value is kept whole, etc.
+# Quotes only delimit a value when not inside a word, so apostrophes
+# ("Can't", "user's") stay part of the template. A literal "<*>" in a message
+# is masked like any other token so render() can rebuild it unambiguously.
+# Numbers may carry a unit suffix ("30s", "500ms", "10MB"); only the number
+# is masked.
+_VARIABLE_TOKEN_PATTERNS = [
+    ("PLACEHOLDER", re.compile(r"<\*>")),
+    ("QUOTED", re.compile(r"(?<!\w)'([^']*)'(?!\w)|(?<!\w)\"([^\"]*)\"(?!\w)")),
+    ("UUID", re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")),
+    ("TIMESTAMP", re.compile(r"\b\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?(?!\d)")),
+    ("IP", re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b")),
+    ("HEX", re.compile(r"\b0x[0-9a-fA-F]+\b")),
+    ("NUM", re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?=[a-zA-Z%]*\b)")),
+]
+
+_PLACEHOLDER = re.compile(r"<\*>")
+
+
+class ErrorTemplate:
+    def __init__(self, template_id: str, error_category: str, template_text: str):
+        self.template_id = template_id
+        self.error_category = error_category
+        self.template_text = template_text
+
+
+class ErrorTemplater:
+    """Clusters raw error messages into templates with stable ids.
+
+    A template is the message with its variable tokens replaced by ``<*>``;
+    its id is derived from the category and template text, so every instance
+    of the orchestrator assigns the same id without coordination.
+
+    Safe to share between threads; both caches are guarded by one lock.
+    """
+
+    def __init__(self, max_cache_size: int = 1024):
+        if max_cache_size < 1:
+            raise ValueError("Template cache size must be at least 1.")
+        self._max_cache_size = max_cache_size
+        # (category, raw message) -> (template, params), most recently used last.
+        self._cache = OrderedDict()
+        # Template ids registered via mark_registered(), most recently used last.
+        self._known_template_ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def mask(message: str):
+        """Returns the template text and the extracted parameters for a message."""
+        spans = []
+        for _, pattern in _VARIABLE_TOKEN_PATTERNS:
+            for match in pattern.finditer(message):
+                # Quoted values keep their quotes in the template.
+                group = next((g for g in range(1, pattern.groups + 1) if match.group(g) is not None), 0)
+                start, end = match.span(group)
+                if any(start < s_end and s_start < end for s_start, s_end in spans):
+                    continue
+                spans.append((start, end))
+        spans.sort()
+
+        parts = []
+        params = []
+        position = 0
+        for start, end in spans:
+            parts.append(message[position:start])
+            parts.append("<*>")
+            params.append(message[start:end])
+            position = end
+        parts.append(message[position:])
+        return "".join(parts), params
+
+    @staticmethod
+    def template_id_for(error_category: str, template_text: str) -> str:
+        key = f"{error_category or ''}|{template_text}".encode("utf-8")
+        return hashlib.sha1(key).hexdigest()[:16]
+
+    def classify(self, error_category: str, error_message: str):
+        """Returns (ErrorTemplate, params, is_new) for a raw error message.
+
+        ``is_new`` is True until the template id is passed to
+        ``mark_registered`` (or again after it was evicted), i.e. while the
+        caller still needs to register the template in the dimension.
+        """
+        cache_key = (error_category, error_message)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                template, params = cached
+                params = list(params)
+            else:
+                template_text, params = self.mask(error_message)
+                template = ErrorTemplate(
+                    template_id=self.template_id_for(error_category, template_text),
+                    error_category=error_category,
+                    template_text=template_text,
+                )
+                self._remember(self._cache, cache_key, (template, tuple(params)))
+
+            is_new = template.template_id not in self._known_template_ids
+            if not is_new:
+                self._known_template_ids.move_to_end(template.template_id)
+        return template, params, is_new
+
+    def mark_registered(self, template_id: str):
+        """Records that a template has been handed off for the dimension load."""
+        with self._lock:
+            self._remember(self._known_template_ids, template_id, True)
+
+    def _remember(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self._max_cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def render(template_text: str, params: list) -> str:
+        """Rebuilds the original message from a template and its parameters."""
+        values = iter(params)
+        return _PLACEHOLDER.sub(lambda _: str(next(values, "<*>")), template_text)
+
+    @staticmethod
+    def serialize_params(params: list) -> str:
+        return json.dumps(params, separators=(",", ":")) if params else ""
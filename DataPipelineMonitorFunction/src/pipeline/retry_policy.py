@@ -0,0 +1,210 @@
+# DataPipelineMonitorFunction/src/pipeline/retry_policy.py
+import os
+import sys
+import time
+import random
+import logging
+from datetime import datetime
+
+# --- START OF MANUAL PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+# --- END OF MANUAL PATH FIX ---
+
+from src.pipeline.pipeline_models import PipelineRunResult
+from src.config import constants
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    def __init__(self, retryable: bool, max_attempts: int = constants.MAX_ATTEMPTS,
+                 base_backoff_seconds: float = constants.BASE_BACKOFF_TIME_SECONDS,
+                 backoff_multiplier: float = 2.0, max_backoff_seconds: float = None,
+                 jitter_ratio: float = 0.1, trips_circuit: bool = False):
+        self.retryable = retryable
+        # A non-retryable failure always stops after the attempt that raised it.
+        self.max_attempts = max_attempts if retryable else 1
+        self.base_backoff_seconds = base_backoff_seconds
+        self.backoff_multiplier = backoff_multiplier
+        self.max_backoff_seconds = max_backoff_seconds
+        self.jitter_ratio = jitter_ratio
+        self.trips_circuit = trips_circuit
+
+    def backoff_seconds(self, attempt_number: int) -> float:
+        """Wait time before the attempt following `attempt_number`."""
+        wait_time = self.base_backoff_seconds * (self.backoff_multiplier ** (attempt_number - 1))
+        if self.max_backoff_seconds is not None:
+            wait_time = min(wait_time, self.max_backoff_seconds)
+        jitter = random.uniform(0, 1) * wait_time * self.jitter_ratio
+        return wait_time + jitter
+
+
+class CircuitBreaker:
+    """Per-pipeline breaker that opens after consecutive dependency-style failures.
+
+    While open, runs of the pipeline are not executed and go straight to the
+    DLQ. After `reset_timeout_seconds` the breaker is half-open: the next run is
+    tried normally and closes it on success or re-opens it on failure.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout_seconds: float, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.last_error_category = None
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def is_open(self) -> bool:
+        if self._opened_at is None:
+            return False
+        return self._clock() - self._opened_at < self.reset_timeout_seconds
+
+    def record_success(self):
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self, error_category: str = None):
+        self._consecutive_failures += 1
+        self.last_error_category = error_category
+        if self._consecutive_failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+
+class RetryPolicyEngine:
+    def __init__(self, policies: dict = None, circuit_breaker_enabled: bool = None, clock=time.monotonic):
+        policies = constants.RETRY_POLICIES if policies is None else policies
+        if circuit_breaker_enabled is None:
+            circuit_breaker_enabled = constants.CIRCUIT_BREAKER_ENABLED
+        self._policies = {category: RetryPolicy(**settings) for category, settings in policies.items()}
+        self._default_policy = RetryPolicy(retryable=True)
+        self._circuit_breaker_enabled = circuit_breaker_enabled
+        self._clock = clock
+        self._breakers = {}
+
+    def policy_for(self, error_category: str) -> RetryPolicy:
+        return self._policies.get(error_category, self._default_policy)
+
+    def breaker_for(self, pipeline_name: str) -> CircuitBreaker:
+        """Returns the pipeline's breaker, or None when circuit breaking is disabled."""
+        if not self._circuit_breaker_enabled:
+            return None
+        if pipeline_name not in self._breakers:
+            self._breakers[pipeline_name] = CircuitBreaker(
+                failure_threshold=constants.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout_seconds=constants.CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS,
+                clock=self._clock,
+            )
+        return self._breakers[pipeline_name]
+
+    def is_circuit_open(self, pipeline_name: str) -> bool:
+        breaker = self.breaker_for(pipeline_name)
+        return breaker is not None and breaker.is_open()
+
+    def record_result(self, pipeline_name: str, success: bool, error_category: str = None):
+        breaker = self.breaker_for(pipeline_name)
+        if breaker is None:
+            return
+        if success:
+            breaker.record_success()
+        elif self.policy_for(error_category).trips_circuit:
+            breaker.record_failure(error_category)
+
+    def should_retry(self, pipeline_name: str, error_category: str, attempt_number: int) -> bool:
+        if attempt_number >= self.policy_for(error_category).max_attempts:
+            return False
+        if self.is_circuit_open(pipeline_name):
+            logger.warning(f"Circuit open for pipeline '{pipeline_name}'; skipping retries.")
+            return False
+        return True
+
+
+class RunOutcome:
+    def __init__(self, run_result: PipelineRunResult, attempt_number: int, attempts_executed: int,
+                 is_dlq: bool, elapsed_seconds: float, short_circuited: bool = False):
+        self.run_result = run_result
+        # Attempt number reported on the event; 0 marks a short-circuited run
+        # that was never executed.
+        self.attempt_number = attempt_number
+        self.attempts_executed = attempts_executed
+        self.is_dlq = is_dlq
+        # Simulated seconds (run durations plus backoff) until the final decision.
+        self.elapsed_seconds = elapsed_seconds
+        self.short_circuited = short_circuited
+
+
+def execute_with_retries(pipeline_name: str, execute, engine: RetryPolicyEngine, wait=time.sleep) -> RunOutcome:
+    """Runs one pipeline run under the engine's retry policies.
+
+    `execute(attempt_number)` returns a PipelineRunResult and `wait(seconds)`
+    performs the backoff, so the same decisions can be replayed offline.
+    """
+    if engine.is_circuit_open(pipeline_name):
+        breaker = engine.breaker_for(pipeline_name)
+        now = datetime.now()
+        run_result = PipelineRunResult(
+            pipeline_name=pipeline_name,
+            success=False,
+            error_category=breaker.last_error_category or constants.ERROR_CATEGORY_DEPENDENCY,
+            error_message=f"Circuit open for pipeline '{pipeline_name}'; run not executed.",
+            duration_seconds=0,
+            start_timestamp=now,
+            end_timestamp=now,
+        )
+        logger.warning(f"Circuit open for pipeline '{pipeline_name}'; sending run to DLQ without executing.")
+        return RunOutcome(run_result, attempt_number=0, attempts_executed=0, is_dlq=True,
+                          elapsed_seconds=0.0, short_circuited=True)
+
+    attempt_number = 1
+    elapsed_seconds = 0.0
+    while True:
+        run_result = execute(attempt_number)
+        engine.record_result(pipeline_name, run_result.success, run_result.error_category)
+        elapsed_seconds += run_result.duration_seconds
+
+        if run_result.success:
+            return RunOutcome(run_result, attempt_number, attempt_number, is_dlq=False,
+                              elapsed_seconds=elapsed_seconds)
+
+        if not engine.should_retry(pipeline_name, run_result.error_category, attempt_number):
+            return RunOutcome(run_result, attempt_number, attempt_number, is_dlq=True,
+                              elapsed_seconds=elapsed_seconds)
+
+        wait_seconds = engine.policy_for(run_result.error_category).backoff_seconds(attempt_number)
+        elapsed_seconds += wait_seconds
+        wait(wait_seconds)
+        attempt_number += 1
+
+
+class RetryStats:
+    def __init__(self):
+        self.runs = 0
+        self.total_attempts = 0
+        self.dlq_runs = 0
+        self.circuit_short_circuits = 0
+        self._time_to_dlq_seconds = []
+
+    def record(self, outcome: RunOutcome):
+        self.runs += 1
+        self.total_attempts += outcome.attempts_executed
+        if outcome.is_dlq:
+            self.dlq_runs += 1
+            self._time_to_dlq_seconds.append(outcome.elapsed_seconds)
+        if outcome.short_circuited:
+            self.circuit_short_circuits += 1
+
+    def summary(self) -> dict:
+        avg_time_to_dlq = (
+            sum(self._time_to_dlq_seconds) / len(self._time_to_dlq_seconds)
+            if self._time_to_dlq_seconds else 0.0
+        )
+        return {
+            "runs": self.runs,
+            "total_attempts": self.total_attempts,
+            "dlq_runs": self.dlq_runs,
+            "circuit_short_circuits": self.circuit_short_circuits,
+            "avg_time_to_dlq_seconds": round(avg_time_to_dlq, 2),
+        }
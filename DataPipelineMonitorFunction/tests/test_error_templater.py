@@ -0,0 +1,150 @@
+import threading
+
+import pytest
+
+from src.pipeline.error_templater import ErrorTemplater
+
+
+@pytest.mark.parametrize("message, template, params", [
+    ("Required field 'user_id' is missing.", "Required field '<*>' is missing.", ["user_id"]),
+    ("Third-party API returned 500.", "Third-party API returned <*>.", ["500"]),
+    ("Database connection timed out.", "Database connection timed out.", []),
+    ("Host 10.0.0.1:5432 refused", "Host <*> refused", ["10.0.0.1:5432"]),
+    ("Job 123e4567-e89b-12d3-a456-426614174000 failed", "Job <*> failed",
+     ["123e4567-e89b-12d3-a456-426614174000"]),
+    ("Bad pointer 0x7ffe", "Bad pointer <*>", ["0x7ffe"]),
+    ("Timed out after 30s", "Timed out after <*>s", ["30"]),
+    ("Failed after 3.5s", "Failed after <*>s", ["3.5"]),
+    ("Slow query: 500ms", "Slow query: <*>ms", ["500"]),
+    ("Payload of 10MB exceeds limit", "Payload of <*>MB exceeds limit", ["10"]),
+    ("CPU at 95% on node", "CPU at <*>% on node", ["95"]),
+    ("Unsupported api v2", "Unsupported api v2", []),
+])
+def test_mask_extracts_variable_tokens(message, template, params):
+    assert ErrorTemplater.mask(message) == (template, params)
+
+
+def test_mask_ignores_apostrophes_inside_words():
+    reach_template, reach_params = ErrorTemplater.mask("Can't reach host 'db1'")
+    find_template, find_params = ErrorTemplater.mask("Can't find file 'db1'")
+
+    assert reach_template == "Can't reach host '<*>'"
+    assert find_template == "Can't find file '<*>'"
+    assert reach_params == find_params == ["db1"]
+    assert (ErrorTemplater.template_id_for("Connection", reach_template)
+            != ErrorTemplater.template_id_for("Connection", find_template))
+
+
+@pytest.mark.parametrize("timestamp", [
+    "2024-01-05",
+    "2024-01-05T10:00:00",
+    "2024-01-05 10:00:00",
+    "2024-01-05T10:00:00Z",
+    "2024-01-05T10:00:00.123Z",
+    "2024-01-05T10:00:00+00:00",
+    "2024-01-05T10:00:00-0530",
+])
+def test_mask_treats_timestamps_as_one_token(timestamp):
+    assert ErrorTemplater.mask(f"Row 12 of batch {timestamp} failed") == (
+        "Row <*> of batch <*> failed", ["12", timestamp]
+    )
+
+
+@pytest.mark.parametrize("message", [
+    "Required field 'user_id' is missing.",
+    "Can't reach host 'db1' at 2024-01-05T10:00:00.123Z after 3 tries",
+    'Query "SELECT 1" returned 0 rows',
+    "x" * 1200,
+    "value <*> and 5",
+    "Template '<*>' has <*> slots",
+])
+def test_render_round_trips_masked_message(message):
+    template, params = ErrorTemplater.mask(message)
+    assert ErrorTemplater.render(template, params) == message
+
+
+def test_classify_gives_same_id_for_same_template():
+    templater = ErrorTemplater()
+    first, first_params, first_new = templater.classify("Dependency", "Third-party API returned 500.")
+    templater.mark_registered(first.template_id)
+    second, second_params, second_new = templater.classify("Dependency", "Third-party API returned 503.")
+
+    assert first.template_id == second.template_id
+    assert (first_params, second_params) == (["500"], ["503"])
+    assert (first_new, second_new) == (True, False)
+
+
+def test_template_stays_new_until_registration_succeeds():
+    templater = ErrorTemplater()
+    uploaded = []
+
+    def register(template, fail):
+        # Mirrors PipelineOrchestrator._template_error_message: mark only after the upload.
+        if fail:
+            raise IOError("blob upload failed")
+        uploaded.append(template.template_id)
+        templater.mark_registered(template.template_id)
+
+    template, _, is_new = templater.classify("Timeout", "Timed out after 30s")
+    assert is_new is True
+    with pytest.raises(IOError):
+        register(template, fail=True)
+
+    template, _, is_new = templater.classify("Timeout", "Timed out after 45s")
+    assert is_new is True
+    register(template, fail=False)
+
+    assert templater.classify("Timeout", "Timed out after 30s")[2] is False
+    assert uploaded == [template.template_id]
+
+
+def test_classify_includes_category_in_template_id():
+    templater = ErrorTemplater()
+    connection, _, _ = templater.classify("Connection", "Timed out.")
+    timeout, _, _ = templater.classify("Timeout", "Timed out.")
+    assert connection.template_id != timeout.template_id
+
+
+def test_cache_evicts_least_recently_used_template():
+    templater = ErrorTemplater(max_cache_size=2)
+    for message in ("first", "second"):
+        templater.mark_registered(templater.classify("Unknown", message)[0].template_id)
+    # Touch "first" so "second" is the least recently used entry.
+    assert templater.classify("Unknown", "first")[2] is False
+
+    templater.mark_registered(templater.classify("Unknown", "third")[0].template_id)
+
+    assert templater.classify("Unknown", "first")[2] is False
+    assert templater.classify("Unknown", "second")[2] is True
+
+
+def test_classify_is_safe_across_threads():
+    templater = ErrorTemplater(max_cache_size=8)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                template, _, is_new = templater.classify("Unknown", f"message {i % 20} kind {(i + offset) % 13}x")
+                if is_new:
+                    templater.mark_registered(template.template_id)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ErrorTemplater(max_cache_size=0)
+
+
+def test_serialize_params():
+    assert ErrorTemplater.serialize_params([]) == ""
+    assert ErrorTemplater.serialize_params(["db1", "500"]) == '["db1","500"]'
@@ -0,0 +1,162 @@
+import random
+
+import pytest
+
+from src.config import constants
+from src.pipeline.pipeline_models import PipelineRunResult
+from src.pipeline.retry_policy import CircuitBreaker, RetryPolicy, RetryPolicyEngine, execute_with_retries
+from src.pipeline.retry_simulation import SimulatedClock, _build_workload, compare_retry_policies
+
+
+def _failure(category, duration_seconds=30):
+    return PipelineRunResult("UserImport", success=False, error_category=category,
+                             error_message="boom", duration_seconds=duration_seconds)
+
+
+def _success(duration_seconds=10):
+    return PipelineRunResult("UserImport", success=True, duration_seconds=duration_seconds)
+
+
+@pytest.mark.parametrize("category", [
+    constants.ERROR_CATEGORY_VALIDATION,
+    constants.ERROR_CATEGORY_SCHEMA,
+    constants.ERROR_CATEGORY_SECURITY,
+    constants.ERROR_CATEGORY_BUSINESSRULE,
+    constants.ERROR_CATEGORY_INVALIDDATA,
+])
+def test_non_transient_categories_are_not_retried(category):
+    engine = RetryPolicyEngine(circuit_breaker_enabled=False)
+    assert engine.should_retry("UserImport", category, attempt_number=1) is False
+
+
+@pytest.mark.parametrize("category", [
+    constants.ERROR_CATEGORY_CONNECTION,
+    constants.ERROR_CATEGORY_DEPENDENCY,
+    constants.ERROR_CATEGORY_RESOURCELIMIT,
+    constants.ERROR_CATEGORY_TIMEOUT,
+    constants.ERROR_CATEGORY_UNKNOWN,
+])
+def test_transient_categories_retry_up_to_their_cap(category):
+    engine = RetryPolicyEngine(circuit_breaker_enabled=False)
+    max_attempts = constants.RETRY_POLICIES[category]["max_attempts"]
+
+    for attempt_number in range(1, max_attempts):
+        assert engine.should_retry("UserImport", category, attempt_number) is True
+    assert engine.should_retry("UserImport", category, max_attempts) is False
+
+
+def test_unconfigured_category_falls_back_to_uniform_policy():
+    engine = RetryPolicyEngine(policies={}, circuit_breaker_enabled=False)
+    policy = engine.policy_for(constants.ERROR_CATEGORY_VALIDATION)
+    assert policy.retryable is True
+    assert policy.max_attempts == constants.MAX_ATTEMPTS
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(retryable=True, base_backoff_seconds=5, backoff_multiplier=2,
+                         max_backoff_seconds=12, jitter_ratio=0)
+    assert [policy.backoff_seconds(n) for n in range(1, 5)] == [5, 10, 12, 12]
+
+
+def test_backoff_jitter_stays_within_ratio():
+    policy = RetryPolicy(retryable=True, base_backoff_seconds=10, jitter_ratio=0.25)
+    for _ in range(100):
+        assert 10 <= policy.backoff_seconds(1) <= 12.5
+
+
+def test_circuit_breaker_opens_half_opens_and_closes():
+    clock = SimulatedClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60, clock=clock)
+
+    breaker.record_failure(constants.ERROR_CATEGORY_DEPENDENCY)
+    assert breaker.is_open() is False
+    breaker.record_failure(constants.ERROR_CATEGORY_DEPENDENCY)
+    assert breaker.is_open() is True
+
+    clock.advance(60)
+    assert breaker.is_open() is False  # half-open: one trial run allowed
+    breaker.record_failure(constants.ERROR_CATEGORY_DEPENDENCY)
+    assert breaker.is_open() is True  # trial failed, re-opened
+
+    clock.advance(60)
+    breaker.record_success()
+    assert breaker.is_open() is False
+    breaker.record_failure(constants.ERROR_CATEGORY_DEPENDENCY)
+    assert breaker.is_open() is False  # count was reset by the success
+
+
+def test_non_tripping_failures_do_not_open_breaker():
+    engine = RetryPolicyEngine(circuit_breaker_enabled=True, clock=SimulatedClock())
+    for _ in range(constants.CIRCUIT_BREAKER_FAILURE_THRESHOLD * 2):
+        engine.record_result("UserImport", False, constants.ERROR_CATEGORY_VALIDATION)
+    assert engine.is_circuit_open("UserImport") is False
+
+
+def test_disabled_breaker_never_opens():
+    engine = RetryPolicyEngine(circuit_breaker_enabled=False)
+    for _ in range(constants.CIRCUIT_BREAKER_FAILURE_THRESHOLD * 2):
+        engine.record_result("UserImport", False, constants.ERROR_CATEGORY_DEPENDENCY)
+    assert engine.breaker_for("UserImport") is None
+    assert engine.is_circuit_open("UserImport") is False
+
+
+def test_open_breaker_short_circuits_without_executing():
+    engine = RetryPolicyEngine(circuit_breaker_enabled=True, clock=SimulatedClock())
+    for _ in range(constants.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        engine.record_result("UserImport", False, constants.ERROR_CATEGORY_CONNECTION)
+
+    def execute(attempt_number):
+        raise AssertionError("pipeline should not run while the circuit is open")
+
+    outcome = execute_with_retries("UserImport", execute, engine, wait=lambda seconds: None)
+
+    assert outcome.is_dlq and outcome.short_circuited
+    assert outcome.attempt_number == outcome.attempts_executed == 0
+    assert outcome.run_result.error_category == constants.ERROR_CATEGORY_CONNECTION
+
+
+def test_execute_with_retries_stops_on_non_retryable_failure():
+    engine = RetryPolicyEngine(circuit_breaker_enabled=False)
+    waits = []
+    results = iter([_failure(constants.ERROR_CATEGORY_SCHEMA), _success()])
+
+    outcome = execute_with_retries("UserImport", lambda n: next(results), engine, wait=waits.append)
+
+    assert outcome.is_dlq and outcome.attempts_executed == 1
+    assert waits == []
+    assert outcome.elapsed_seconds == 30
+
+
+def test_execute_with_retries_backs_off_then_succeeds():
+    engine = RetryPolicyEngine(circuit_breaker_enabled=False)
+    waits = []
+    results = iter([_failure(constants.ERROR_CATEGORY_TIMEOUT), _success()])
+
+    outcome = execute_with_retries("UserImport", lambda n: next(results), engine, wait=waits.append)
+
+    assert not outcome.is_dlq and outcome.attempts_executed == 2
+    assert len(waits) == 1
+    assert outcome.elapsed_seconds == pytest.approx(40 + waits[0])
+
+
+def test_compare_retry_policies_replays_same_workload():
+    report = compare_retry_policies(total_runs=200, seed=7)
+    uniform, category = report["uniform_policy"], report["category_policies"]
+
+    assert uniform["runs"] == category["runs"] == 200
+    assert report["attempts_saved"] == uniform["total_attempts"] - category["total_attempts"]
+    assert category["dlq_runs"] - uniform["dlq_runs"] == (
+        report["early_dlq_runs_uniform_would_recover"] - report["dlq_runs_avoided"]
+    )
+    assert report["paired_time_to_dlq"]["runs"] <= min(uniform["dlq_runs"], category["dlq_runs"])
+
+
+def test_non_retryable_failures_persist_in_simulated_workload():
+    random.seed(3)
+    workload = _build_workload(total_runs=500, max_attempts=4)
+    non_retryable = {c for c, settings in constants.RETRY_POLICIES.items() if not settings.get("retryable", True)}
+
+    for _, results, _ in workload:
+        for earlier, later in zip(results, results[1:]):
+            if not earlier.success and earlier.error_category in non_retryable:
+                assert later is earlier